@@ -1,12 +1,12 @@
 import os
+import csv
+import math
 from launch import LaunchDescription
 from ament_index_python import get_package_share_directory
 from launch_ros.actions import Node
 from datetime import datetime
 from launch.actions import ExecuteProcess
-import numpy as np
 import launch
-from ament_index_python.packages import get_package_share_directory
 
 def generate_launch_description():
     ld = LaunchDescription()
@@ -17,28 +17,12 @@ def generate_launch_description():
     # if you use matlab planning do not consider this!
     #chicane traj as in sim
     simulation_time = 20
-    n_samples = int(20. / path_gen_dt)
-    t = np.linspace(0., path_gen_dt*n_samples, n_samples)
-    v_vec = []
-    omega_vec = []
     t1 = 0.1*simulation_time
     t2 = 0.6*simulation_time
     omega_max = 0.3
     v_max = 0.2
-    for i in range(t.shape[0]):
-        if (t[i] < t1):
-            v_vec.append(v_max * t[i])
-            omega_vec.append(0)
-     
-        elif (t[i] < t2):            
-            v_vec.append(v_max)
-            omega_vec.append(omega_max)
+    v_vec, omega_vec = get_chicane_traj(path_gen_dt, simulation_time, v_max, omega_max, t1, t2)
 
-        else:
-            v_vec.append(v_max)
-            omega_vec.append(-omega_max)
-      
-    
     # longitudinal_velocity = 0.4
     # angular_velocity1 = 0.2
     # angular_velocity2 = -0.2
@@ -120,20 +104,28 @@ def generate_launch_description():
     ld.add_action(optitrack_node)
     ld.add_action(controller_node)
 
-    now = datetime.now()
-    dt_string = now.strftime("%d-%m-%H-%M-%S")
-    param_string = 'exp_'
-    bag_string = 'bagfiles/slip_test_'
-    bag_name = bag_string + param_string + dt_string + '.bag'
-    record_node = ExecuteProcess(
-        cmd=['ros2', 'bag', 'record', '-a', '-o%s' %bag_name]
-    )
-    
- 
     if RosBagRecord:
+        bag_name = f"bagfiles/slip_test_exp_{datetime.now():%d-%m-%H-%M-%S}.bag"
+        record_node = ExecuteProcess(
+            cmd=['ros2', 'bag', 'record', '-a', f'-o{bag_name}']
+        )
         ld.add_action(record_node)
     return ld
 
+def get_chicane_traj(path_gen_dt, simulation_time, v_max, omega_max, t1, t2):
+    # plain lists, so that launching does not need to import numpy
+    n_samples = int(simulation_time / path_gen_dt)
+    # ramp up to v_max until t1, then turn left until t2 and right afterwards.
+    # The phases are contiguous, so each one is a run of samples: on the
+    # i*dt grid ceil(t/dt) samples satisfy i*dt < t (the tolerance absorbs the
+    # float noise of t being a multiple of dt). With t2 < t1 there is no left
+    # turn, the right turn starts at t1
+    i1 = min(max(math.ceil(t1 / path_gen_dt - 1e-9), 0), n_samples)
+    i2 = min(max(math.ceil(t2 / path_gen_dt - 1e-9), i1), n_samples)
+    v_vec = [v_max * (i * path_gen_dt) for i in range(i1)] + [v_max] * (n_samples - i1)
+    omega_vec = [0.0] * i1 + [omega_max] * (i2 - i1) + [-omega_max] * (n_samples - i2)
+    return v_vec, omega_vec
+
 def extract_settings_from_dubins(omega_vec, time_vec, dt):
     # omega_vec, since it represents a Dubins path, can have
     # maximum 3 values. Each value represents how the robot 
@@ -141,168 +133,50 @@ def extract_settings_from_dubins(omega_vec, time_vec, dt):
     # time vec has maximum 4 values and represents the time 
     # interval edges. This function extract the desired omega_vec
     # for each integration step
-    omega_fine_vec = []
-    for i in range(len(omega_vec)):
-        omega_motion = omega_vec[i]
-        n = int((time_vec[i+1] - time_vec[i]) / dt)
-        omegas_tmp = np.linspace(omega_motion, omega_motion, n).tolist()
-        omega_fine_vec += omegas_tmp
-    return omega_fine_vec
+    import numpy as np
+    counts = [int((time_vec[i+1] - time_vec[i]) / dt) for i in range(len(omega_vec))]
+    omega_fine_vec = np.empty(sum(counts))
+    k = 0
+    for omega_motion, n in zip(omega_vec, counts):
+        omega_fine_vec[k:k+n] = omega_motion
+        k += n
+    return omega_fine_vec.tolist()
+
+# Dubins experiments: for each experiment id, config/dubins_experiments.csv
+# holds the omega of each of the (maximum 3) path segments and the (maximum 4)
+# time edges of the segments (id 100 is the special case with one constant
+# curve). The file is read once, on first use
+_exp_tables = None
+
+def get_exp_tables():
+    global _exp_tables
+    if _exp_tables is None:
+        package_share_dir = get_package_share_directory('lyapunov_slippage_controller')
+        path_csv = os.path.join(package_share_dir, 'config/', 'dubins_experiments.csv')
+        omegas = {}
+        times = {}
+        with open(path_csv, 'r') as csv_file:
+            for row in csv.DictReader(csv_file):
+                exp_id = int(row['exp_id'])
+                omegas[exp_id] = tuple(float(row[c]) for c in ('omega1', 'omega2', 'omega3'))
+                times[exp_id] = tuple(float(row[c]) for c in ('t0', 't1', 't2', 't3'))
+        _exp_tables = (omegas, times)
+    return _exp_tables
 
 def get_exp_omega_vec(exp_id, scale_factor):
-    if(exp_id == 1):
-        return (np.array([-0.2000, 0, 0.2000])*scale_factor).tolist() 
-    elif(exp_id == 2):
-        return (np.array([-0.2000, 0, -0.2000])*scale_factor).tolist()
-    elif(exp_id == 3):
-        return (np.array([-0.2000, 0, -0.2000])*scale_factor).tolist()
-    elif(exp_id == 4):
-        return (np.array([-0.2000, 0, -0.2000])*scale_factor).tolist()
-    elif(exp_id == 5):
-        return (np.array([-0.2000, 0, 0.2000])*scale_factor).tolist()
-    elif(exp_id == 6):
-        return (np.array([0.1786, 0, 0.1786])*scale_factor).tolist()
-    elif(exp_id == 7):
-        return (np.array([-0.1786, 0, -0.1786])*scale_factor).tolist()
-    elif(exp_id == 8):
-        return (np.array([-0.1786, 0, -0.1786])*scale_factor).tolist()
-    elif(exp_id == 9):
-        return (np.array([-0.1786, 0, -0.1786])*scale_factor).tolist()
-    elif(exp_id == 10):
-        return (np.array([-0.1786, 0, 0.1786])*scale_factor).tolist()
-    elif(exp_id == 11):
-        return (np.array([0.1667, 0, 0.1667])*scale_factor).tolist()
-    elif(exp_id == 12):
-        return (np.array([-0.1667, 0, -0.1667])*scale_factor).tolist()
-    elif(exp_id == 13):
-        return (np.array([-0.1667, 0, -0.1667])*scale_factor).tolist()
-    elif(exp_id == 14):
-        return (np.array([0.1667, 0, -0.1667])*scale_factor).tolist()
-    elif(exp_id == 15):
-        return (np.array([-0.1667, 0, 0.1667])*scale_factor).tolist()
-    elif(exp_id == 16):
-        return (np.array([0.1562, 0, 0.1562])*scale_factor).tolist()
-    elif(exp_id == 17):
-        return (np.array([-0.1562, 0, -0.1562])*scale_factor).tolist()
-    elif(exp_id == 18):
-        return (np.array([0.1562, -0.1562, 0.1562])*scale_factor).tolist()
-    elif(exp_id == 19):
-        return (np.array([0.1562, 0, -0.1562])*scale_factor).tolist()
-    elif(exp_id == 20):
-        return (np.array([-0.1562, 0, 0.1562])*scale_factor).tolist()
-    elif(exp_id == 21):
-        return (np.array([0.1429, 0, 0.1429])*scale_factor).tolist()
-    elif(exp_id == 22):
-        return (np.array([-0.1429, 0, -0.1429])*scale_factor).tolist()
-    elif(exp_id == 23):
-        return (np.array([0.1429, -0.1429, 0.1429])*scale_factor).tolist()
-    elif(exp_id == 24):
-        return (np.array([0.1429, 0, -0.1429])*scale_factor).tolist()
-    elif(exp_id == 25):
-        return (np.array([-0.1429, 0, 0.1429])*scale_factor).tolist()
-    elif(exp_id == 26):
-        return (np.array([0.1250, 0, 0.1250])*scale_factor).tolist()
-    elif(exp_id == 27):
-        return (np.array([-0.1250, 0, -0.1250])*scale_factor).tolist()
-    elif(exp_id == 28):
-        return (np.array([0.1250, -0.1250, 0.1250])*scale_factor).tolist()
-    elif(exp_id == 29):
-        return (np.array([0.1250, 0, -0.1250])*scale_factor).tolist()
-    elif(exp_id == 30):
-        return (np.array([-0.1250, 0.1250, -0.1250])*scale_factor).tolist()
-    elif(exp_id == 31):
-        return (np.array([0.1111, 0, 0.1111])*scale_factor).tolist()
-    elif(exp_id == 32):
-        return (np.array([-0.1111, 0, -0.1111])*scale_factor).tolist()
-    elif(exp_id == 33):
-        return (np.array([-0.1111, 0.1111, -0.1111])*scale_factor).tolist()
-    elif(exp_id == 34):
-        return (np.array([0.1111, 0, -0.1111])*scale_factor).tolist()
-    elif(exp_id == 35):
-        return (np.array([-0.1111, 0.1111, -0.1111])*scale_factor).tolist()
-    elif(exp_id == 100): # special case with one constant curve
-        return (np.array([-0.1111, -0.1111, -0.1111])*scale_factor).tolist()
-    elif(exp_id == -1): 
+    if(exp_id == -1):
         return [0.5, 0, 0.5]
-    else:
+    omegas = get_exp_tables()[0].get(exp_id)
+    if omegas is None:
         print("ID for experiment selection is not in range")
-        return (np.array([0.0,0.0,0.0])*scale_factor).tolist()
-    
+        return [0.0, 0.0, 0.0]
+    return [omega*scale_factor for omega in omegas]
+
 def get_exp_time_vec(exp_id, scale_factor):
-    if(exp_id == 1):
-        return (np.array([0.0, 19.8656, 28.0567, 45.3838])/scale_factor).tolist()
-    elif(exp_id == 2):
-        return (np.array([0.0, 9.0934, 29.1615, 45.6651])/scale_factor).tolist()
-    elif(exp_id == 3):
-        return (np.array([0.0, 5.6814, 7.7114, 11.3149])/scale_factor).tolist()
-    elif(exp_id == 4):
-        return (np.array([0.0, 0.3347, 16.6246, 35.8269])/scale_factor).tolist()
-    elif(exp_id == 5):
-        return (np.array([0.0, 2.8880, 12.3754, 31.8318])/scale_factor).tolist()
-    elif(exp_id == 6):
-        return (np.array([0.0, 21.5474, 38.1293, 48.9246])/scale_factor).tolist()
-    elif(exp_id == 7):
-        return (np.array([0.0, 10.0573, 29.6439, 48.2553])/scale_factor).tolist()
-    elif(exp_id == 8):
-        return (np.array([0.0, 7.3706, 8.4783, 11.5068])/scale_factor).tolist()
-    elif(exp_id == 9):
-        return (np.array([0.0, 0.0192, 16.6885, 38.5508])/scale_factor).tolist()
-    elif(exp_id == 10):
-        return (np.array([0.0, 3.9496, 12.1589, 34.6651])/scale_factor).tolist()
-    elif(exp_id == 11):
-        return (np.array([0.0, 23.1464, 39.6140, 51.1204])/scale_factor).tolist()
-    elif(exp_id == 12):
-        return (np.array([0.0, 10.6810, 29.9524, 49.9879])/scale_factor).tolist()
-    elif(exp_id == 13):
-        return (np.array([0.0, 10.5359, 11.1047, 11.7107])/scale_factor).tolist()
-    elif(exp_id == 14):
-        return (np.array([0.0, 0.2264, 16.7320, 40.4028])/scale_factor).tolist()
-    elif(exp_id == 15):
-        return (np.array([0.0, 4.8173, 11.9395, 36.6388])/scale_factor).tolist()
-    elif(exp_id == 16):
-        return (np.array([0.0, 24.7544, 41.1092, 53.3178])/scale_factor).tolist()
-    elif(exp_id == 17):
-        return (np.array([0.0, 11.2888, 30.2499, 51.7254])/scale_factor).tolist()
-    elif(exp_id == 18):
-        return (np.array([0.0, 8.1929, 36.7281, 45.1858])/scale_factor).tolist()
-    elif(exp_id == 19):
-        return (np.array([0.0, 0.5041, 16.7712, 42.2826])/scale_factor).tolist()
-    elif(exp_id == 20):
-        return (np.array([0.0, 5.8789, 11.6051, 38.6915])/scale_factor).tolist()
-    elif(exp_id == 21):
-        return (np.array([0.0, 27.1833, 43.3722, 56.6172])/scale_factor).tolist()
-    elif(exp_id == 22):
-        return (np.array([0.0, 12.1688, 30.6746, 54.3416])/scale_factor).tolist()
-    elif(exp_id == 23):
-        return (np.array([0.0, 9.3380, 41.2895, 50.9040])/scale_factor).tolist()
-    elif(exp_id == 24):
-        return (np.array([0.0, 0.9820, 16.8197, 45.1535])/scale_factor).tolist()
-    elif(exp_id == 25):
-        return (np.array([0.0, 8.4519, 10.3232, 41.9709])/scale_factor).tolist()
-    elif(exp_id == 26):
-        return (np.array([0.0, 31.2785, 47.1997, 62.1250])/scale_factor).tolist()
-    elif(exp_id == 27):
-        return (np.array([0.0, 13.5450, 31.3201, 58.7304])/scale_factor).tolist()
-    elif(exp_id == 28):
-        return (np.array([0.0, 11.2103, 48.7807, 60.2848])/scale_factor).tolist()
-    elif(exp_id == 29):
-        return (np.array([0.0, 1.9505, 16.8618, 50.0715])/scale_factor).tolist()
-    elif(exp_id == 30):
-        return (np.array([0.0, 10.7391, 48.8406, 49.6937])/scale_factor).tolist()
-    elif(exp_id == 31):
-        return (np.array([0.0, 35.4345, 51.0996, 67.6444])/scale_factor).tolist()
-    elif(exp_id == 32):
-        return (np.array([0.0, 14.7966, 31.8806, 63.1587])/scale_factor).tolist()
-    elif(exp_id == 33):
-        return (np.array([0.0, 6.3935, 60.7169, 68.8110])/scale_factor).tolist()
-    elif(exp_id == 34):
-        return (np.array([0.0, 3.1564, 16.8304, 55.1535])/scale_factor).tolist()
-    elif(exp_id == 35):
-        return (np.array([0.0, 12.0166, 55.6281, 57.4000])/scale_factor).tolist()
-    elif(exp_id == 100): # special case with one constant curve
-        return (np.array([0.0, 12.0166, 55.6281, 57.4000])/scale_factor).tolist()
-    elif(exp_id == -1): 
+    if(exp_id == -1):
         return [0.0, 1.53204654144835,8.12756557496897,9.74385138162452]
-    else:
+    times = get_exp_tables()[1].get(exp_id)
+    if times is None:
         print("ID for experiment selection is not in range")
-        return (np.array([0.0, 0.0, 0.0, 0.0])/scale_factor).tolist()
\ No newline at end of file
+        return [0.0, 0.0, 0.0, 0.0]
+    return [time/scale_factor for time in times]